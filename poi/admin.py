@@ -21,7 +21,7 @@ class PointOfInterestAdmin(admin.ModelAdmin):
     
     search_fields = ['internal_id', 'external_id', 'name', 'category', 'description']
     
-    readonly_fields = ['internal_id', 'created_at', 'updated_at']
+    readonly_fields = ['internal_id', 'ratings_count', 'average_rating', 'created_at', 'updated_at']
     
     fieldsets = (
         ('Basic Information', {
@@ -31,7 +31,7 @@ class PointOfInterestAdmin(admin.ModelAdmin):
             'fields': ('latitude', 'longitude')
         }),
         ('Details', {
-            'fields': ('ratings', 'description')
+            'fields': ('ratings', 'ratings_count', 'average_rating', 'description')
         }),
         ('Metadata', {
             'fields': ('created_at', 'updated_at'),
@@ -39,6 +39,15 @@ class PointOfInterestAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Load only the columns the changelist renders, skipping description."""
+        queryset = super().get_queryset(request)
+        # The change form needs every field, so only narrow the list page
+        changelist = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if request.resolver_match and request.resolver_match.url_name == changelist:
+            queryset = queryset.only('internal_id', 'external_id', 'name', 'category', 'average_rating')
+        return queryset
+    
     def average_rating_display(self, obj):
         """Display average rating with 2 decimal places."""
         try:
@@ -46,6 +55,7 @@ class PointOfInterestAdmin(admin.ModelAdmin):
         except:
             return "0.00"
     average_rating_display.short_description = 'Avg. Rating'
+    average_rating_display.admin_order_field = 'average_rating'
     
     def has_add_permission(self, request):
         """Disable manual addition - PoIs should only be imported via command."""
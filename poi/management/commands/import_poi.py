@@ -1,16 +1,66 @@
 import csv
+import io
 import json
-import xml.etree.ElementTree as ET
+import os
+import shutil
+import tempfile
 import requests
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from decimal import Decimal
+from operator import itemgetter
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, models, transaction
+from django.utils import timezone
 from poi.models import PointOfInterest
 
+try:
+    # orjson decodes several times faster than the json module; its
+    # JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # pyarrow's multithreaded CSV reader, used for local CSV files when installed
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+except ImportError:
+    pyarrow_csv = None
+
+try:
+    # lxml does the parsing and tree walking in C; fall back to the standard library
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# Element tags that wrap a single POI record in the supported XML layouts
+POI_TAGS = {'poi', 'point', 'item', 'DATA_RECORD'}
+
+# CSV columns read for each POI, in the order the import loops unpack them
+CSV_COLUMNS = ('poi_id', 'poi_name', 'poi_latitude', 'poi_longitude', 'poi_category', 'poi_ratings')
+
 
 class Command(BaseCommand):
     help = 'Import Point of Interest data from CSV, JSON, or XML files'
+    batch_size = 1000
+    use_copy = False
+    dry_run = False
+    workers = 4
+    session = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Local file importers by lower-case file extension
+        self.importers = {
+            '.csv': self.import_csv,
+            '.json': self.import_json,
+            '.xml': self.import_xml,
+        }
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -24,139 +74,269 @@ class Command(BaseCommand):
             action='store_true',
             help='Update existing records instead of skipping them'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of records written to the database per batch (default: 1000)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of URLs to download concurrently (default: 4)'
+        )
+        parser.add_argument(
+            '--use-copy',
+            action='store_true',
+            help='Write batches with PostgreSQL COPY instead of INSERT/UPDATE statements'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Parse the files and build the records without touching the database'
+        )
 
     def handle(self, *args, **options):
         file_paths = options['file_paths']
         update_existing = options['update']
+        self.batch_size = options['batch_size']
+        self.use_copy = options['use_copy']
+        self.dry_run = options['dry_run']
+        self.workers = options['workers']
+        
+        if self.batch_size < 1:
+            raise CommandError('--batch-size must be a positive integer')
+        if self.workers < 1:
+            raise CommandError('--workers must be a positive integer')
+        if self.use_copy and connection.vendor != 'postgresql':
+            raise CommandError('--use-copy is only supported on PostgreSQL')
         
         total_imported = 0
         total_skipped = 0
         total_updated = 0
         
-        for file_path in file_paths:
-            try:
-                imported, skipped, updated = self.import_file(str(file_path), update_existing)
-                total_imported += imported
-                total_skipped += skipped
-                total_updated += updated
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'Processed URL {file_path}: {imported} imported, {skipped} skipped, {updated} updated'
+        # Download remote files in the background while earlier files are
+        # parsed and saved; database writes stay on this thread.
+        urls = [str(path) for path in file_paths if str(path).startswith(('http://', 'https://'))]
+        if urls and self.session is None:
+            self.session = self.create_session()
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        downloads = {url: executor.submit(self.download, url) for url in dict.fromkeys(urls)}
+        
+        try:
+            for file_path in file_paths:
+                try:
+                    imported, skipped, updated = self.import_file(
+                        str(file_path), update_existing, downloads.pop(str(file_path), None)
+                    )
+                    total_imported += imported
+                    total_skipped += skipped
+                    total_updated += updated
+                    
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f'Processed URL {file_path}: {imported} imported, {skipped} skipped, {updated} updated'
+                        )
                     )
-                )
                 
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'Error processing URL {file_path}: {str(e)}')
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.ERROR(f'Error processing URL {file_path}: {str(e)}')
+                    )
+            
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'\nTotal: {total_imported} imported, {total_skipped} skipped, {total_updated} updated'
                 )
-        
-        self.stdout.write(
-            self.style.SUCCESS(
-                f'\nTotal: {total_imported} imported, {total_skipped} skipped, {total_updated} updated'
             )
-        )
+            if self.dry_run:
+                self.stdout.write(self.style.WARNING('Dry run: nothing was written to the database'))
+        finally:
+            # Cancel queued downloads and release the pooled connections even if interrupted
+            executor.shutdown(cancel_futures=True)
+            if self.session is not None:
+                self.session.close()
+                self.session = None
 
-    def import_file(self, file_path, update_existing):
+    def import_file(self, file_path, update_existing, download=None):
         """Import data from a single file or URL based on its extension."""
-        # Check if it's a URL
-        if str(file_path).startswith(('http://', 'https://')):
-            return self.import_from_url(file_path, update_existing)
-        
-        # Handle local file
-        # extension = file_path.suffix.lower()
-        extension = Path(file_path).suffix.lower()
-        
-        if extension == '.csv':
-            return self.import_csv(file_path, update_existing)
-        elif extension == '.json':
-            return self.import_json(file_path, update_existing)
-        elif extension == '.xml':
-            return self.import_xml(file_path, update_existing)
-        else:
-            raise CommandError(f'Unsupported file format: {extension}')
+        is_url = str(file_path).startswith(('http://', 'https://'))
+        if is_url:
+            # Wait for the download before opening the transaction, so the
+            # connection does not sit idle in it while the file arrives
+            response, body = self.wait_for_download(file_path, download)
+        
+        # One transaction per file instead of one per record; a dry run needs none
+        with nullcontext() if self.dry_run else transaction.atomic():
+            if not self.dry_run and connection.vendor == 'postgresql':
+                # Don't wait for the WAL flush on commit; a crash can only lose
+                # the most recent imports, which can simply be re-run
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL synchronous_commit = OFF')
+            
+            # Check if it's a URL
+            if is_url:
+                return self.import_from_url(file_path, update_existing, response, body)
+        
+            # Handle local file
+            extension = os.path.splitext(file_path)[1].lower()
+        
+            importer = self.importers.get(extension)
+            if importer is None:
+                raise CommandError(f'Unsupported file format: {extension}')
+            return importer(file_path, update_existing)
 
-    def import_from_url(self, url, update_existing):
-        """Import data from a remote URL."""
+    def wait_for_download(self, url, download=None):
+        """Return the response and body of a URL.
+        
+        download is an optional future for a download already started by
+        handle(); otherwise the URL is fetched here.
+        """
         try:
-            self.stdout.write(f'Downloading data from: {url}')
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Determine file type from URL or content
-            content_type = response.headers.get('content-type', '').lower()
-            
-            if 'csv' in content_type or url.lower().endswith('.csv'):
-                return self.import_csv_from_content(response.text, update_existing, url)
-            elif 'json' in content_type or url.lower().endswith('.json'):
-                return self.import_json_from_content(response.text, update_existing, url)
-            elif 'xml' in content_type or url.lower().endswith('.xml'):
-                return self.import_xml_from_content(response.text, update_existing, url)
-            else:
-                raise CommandError(f'Could not determine file type for URL: {url}')
-                    
+            if download is None:
+                return self.download(url)
+            return download.result()
         except requests.RequestException as e:
             raise CommandError(f'Failed to download from URL {url}: {str(e)}')
+
+    def import_from_url(self, url, update_existing, response, body):
+        """Import data from a downloaded URL."""
+        try:
+            with body:
+                # Determine file type from URL or content
+                content_type = response.headers.get('content-type', '').lower()
+            
+                if 'csv' in content_type or url.lower().endswith('.csv'):
+                    lines = io.TextIOWrapper(body, encoding=response.encoding or 'utf-8', newline='')
+                    return self.import_csv_from_content(lines, update_existing, url)
+                elif 'json' in content_type or url.lower().endswith('.json'):
+                    return self.import_json_from_content(body.read(), update_existing, url)
+                elif 'xml' in content_type or url.lower().endswith('.xml'):
+                    return self.import_xml_from_content(body, update_existing, url)
+                else:
+                    raise CommandError(f'Could not determine file type for URL: {url}')
+                    
+        except CommandError:
+            raise
         except Exception as e:
             raise CommandError(f'Error processing URL {url}: {str(e)}')
 
+    def download(self, url):
+        """Download a URL into a temporary file and return it with the response."""
+        if self.session is None:
+            self.session = self.create_session()
+        
+        self.stdout.write(f'Downloading data from: {url}')
+        with self.session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            # Spool to disk so concurrent downloads do not pile up in memory
+            body = tempfile.TemporaryFile()
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, body)
+            body.seek(0)
+        return response, body
+
+    def create_session(self):
+        """Create an HTTP session that keeps connections alive between downloads."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            # One connection per download thread, plus the main thread's own fetches
+            pool_maxsize=self.workers + 1,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def import_csv_from_content(self, content, update_existing, source_name):
         """Import data from CSV content."""
         imported = 0
         skipped = 0
         updated = 0
+        batch = []
         
         try:
-            # Split content into lines and create a CSV reader
-            lines = content.splitlines()
-            if not lines:
+            # Read rows straight from the text or line stream without splitting it up front
+            if isinstance(content, str):
+                content = io.StringIO(content, newline='')
+            
+            reader = csv.reader(content)
+            header = next(reader, None)
+            if header is None:
                 self.stdout.write(self.style.WARNING(f'Empty CSV content from {source_name}'))
                 return 0, 0, 0
-            
-            reader = csv.DictReader(lines)
+            get_fields = self.csv_field_getter(header)
             
             for row in reader:
-                try:
-                    poi_data = {
-                        'external_id': row['poi_id'],
-                        'name': row['poi_name'],
-                        'latitude': Decimal(row['poi_latitude']),
-                        'longitude': Decimal(row['poi_longitude']),
-                        'category': row['poi_category'],
-                        'ratings': self.parse_ratings(row['poi_ratings']),
-                    }
-                    
-                    imported_count, skipped_count, updated_count = self.save_poi(
-                        poi_data, update_existing
-                    )
-                    imported += imported_count
-                    skipped += skipped_count
-                    updated += updated_count
-                    
-                except KeyError as e:
-                    self.stdout.write(
-                        self.style.WARNING(f'Missing required field in CSV from {source_name}: {e}')
-                    )
-                    skipped += 1
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(f'Error processing CSV row from {source_name}: {e}')
-                    )
+                if not row:
+                    continue
+                if len(row) < len(header):
+                    # Pad short rows with None as DictReader did, so a row that only
+                    # lacks the ratings column is still imported without ratings
+                    row += [None] * (len(header) - len(row))
+                
+                poi_data, error = self.parse_csv_row(get_fields(row), source_name)
+                if error is None:
+                    batch.append(poi_data)
+                else:
+                    self.stdout.write(self.style.WARNING(error))
                     skipped += 1
             
+                if len(batch) >= self.batch_size:
+                    imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+            
+            imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+            
             return imported, skipped, updated
             
         except Exception as e:
             raise CommandError(f'Error processing CSV content from {source_name}: {str(e)}')
 
+    def csv_field_getter(self, header):
+        """Return a getter that pulls the POI columns out of a CSV row in CSV_COLUMNS order."""
+        missing = [column for column in CSV_COLUMNS if column not in header]
+        if missing:
+            raise CommandError(f'Missing required field in CSV: {", ".join(missing)}')
+        return itemgetter(*(header.index(column) for column in CSV_COLUMNS))
+
+    def parse_csv_row(self, values, source_name):
+        """Build the POI data for a row's CSV_COLUMNS values.
+        
+        Returns (poi_data, None), or (None, warning) if the row cannot be
+        imported. Columns a short row lacked are None; only poi_ratings may be.
+        """
+        try:
+            external_id, name, latitude, longitude, category, ratings = values
+            if None in values:
+                for column, value in zip(CSV_COLUMNS, values):
+                    if value is None and column != 'poi_ratings':
+                        raise KeyError(column)
+            poi_data = {
+                'external_id': external_id,
+                'name': name,
+                'latitude': Decimal(latitude),
+                'longitude': Decimal(longitude),
+                'category': category,
+                'ratings': self.parse_ratings(ratings),
+            }
+            return poi_data, None
+        
+        except KeyError as e:
+            return None, f'Missing required field in CSV from {source_name}: {e}'
+        except Exception as e:
+            return None, f'Error processing CSV row from {source_name}: {e}'
+
     def import_json_from_content(self, content, update_existing, source_name):
         """Import data from JSON content."""
         imported = 0
         skipped = 0
         updated = 0
+        batch = []
         
         try:
-            data = json.loads(content)
+            data = json_loads(content)
             
             # Handle both single object and array of objects
             if isinstance(data, dict):
@@ -173,13 +353,7 @@ class Command(BaseCommand):
                         'ratings': self.parse_ratings(item['ratings']),
                         'description': item.get('description', ''),
                     }
-                    
-                    imported_count, skipped_count, updated_count = self.save_poi(
-                        poi_data, update_existing
-                    )
-                    imported += imported_count
-                    skipped += skipped_count
-                    updated += updated_count
+                    batch.append(poi_data)
                     
                 except KeyError as e:
                     self.stdout.write(
@@ -191,6 +365,11 @@ class Command(BaseCommand):
                         self.style.WARNING(f'Error processing JSON item from {source_name}: {e}')
                     )
                     skipped += 1
+                
+                if len(batch) >= self.batch_size:
+                    imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+            
+            imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
             
             return imported, skipped, updated
             
@@ -204,40 +383,28 @@ class Command(BaseCommand):
         imported = 0
         skipped = 0
         updated = 0
+        batch = []
         
         try:
-            root = ET.fromstring(content)
-            
-            # Handle different XML structures
-            poi_elements = root.findall('.//poi') or root.findall('.//point') or root.findall('.//item') or root.findall('.//DATA_RECORD')
-            
-            if not poi_elements:
-                # Try to treat the root as a single POI
-                poi_elements = [root]
-            
-            # Check if we found any valid XML elements
-            if not poi_elements or len(poi_elements) == 0:
-                raise ET.ParseError("No valid XML elements found")
+            if isinstance(content, str):
+                content = io.BytesIO(content.encode('utf-8'))
             
-            for poi_element in poi_elements:
+            for poi_element in self.iter_xml_elements(content):
                 try:
+                    # Index the children once instead of scanning them for every field;
+                    # reversed() keeps the first child of each tag, as find() did
+                    fields = {child.tag: child.text for child in reversed(poi_element)}
                     poi_data = {
-                        'external_id': poi_element.find('pid').text,
-                        'name': poi_element.find('pname').text,
-                        'latitude': Decimal(poi_element.find('platitude').text),
-                        'longitude': Decimal(poi_element.find('plongitude').text),
-                        'category': poi_element.find('pcategory').text,
-                        'ratings': self.parse_ratings(poi_element.find('pratings').text),
+                        'external_id': fields['pid'],
+                        'name': fields['pname'],
+                        'latitude': Decimal(fields['platitude']),
+                        'longitude': Decimal(fields['plongitude']),
+                        'category': fields['pcategory'],
+                        'ratings': self.parse_ratings(fields['pratings']),
                     }
+                    batch.append(poi_data)
                     
-                    imported_count, skipped_count, updated_count = self.save_poi(
-                        poi_data, update_existing
-                    )
-                    imported += imported_count
-                    skipped += skipped_count
-                    updated += updated_count
-                    
-                except AttributeError as e:
+                except KeyError as e:
                     self.stdout.write(
                         self.style.WARNING(f'Missing required field in XML from {source_name}: {e}')
                     )
@@ -248,49 +415,97 @@ class Command(BaseCommand):
                     )
                     skipped += 1
                     
+                if len(batch) >= self.batch_size:
+                    imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+        
         except (ET.ParseError, AttributeError, ValueError) as e:
-            # If XML parsing fails, try to parse as space-separated format (SearchSmartly format)
-            self.stdout.write(f'XML parsing failed, trying SearchSmartly format: {e}')
+            # Records are streamed, so fail the whole import rather than keep a truncated document's batches
+            raise CommandError(f'Invalid XML content from {source_name}: {e}')
+        
+        imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
     
         return imported, skipped, updated
 
     def import_csv(self, file_path, update_existing):
         """Import data from CSV file."""
+        if pyarrow_csv is not None:
+            with nullcontext() if self.dry_run else transaction.atomic():
+                counts = self.import_csv_arrow(file_path, update_existing)
+                if counts is None and not self.dry_run:
+                    # Undo the batches already saved before the file is read again
+                    transaction.set_rollback(True)
+            if counts is not None:
+                return counts
+        
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            return self.import_csv_from_content(file, update_existing, file_path)
+
+    def import_csv_arrow(self, file_path, update_existing):
+        """Import data from CSV file with pyarrow's streaming columnar reader.
+        
+        Blocks of rows are parsed in C++ and walked column by column, instead
+        of building a Python list for every row. pyarrow rejects rows whose
+        column count differs from the header, which the csv module path pads
+        or trims; as soon as it does, None is returned so the caller can roll
+        back and re-read the whole file in order with the csv module.
+        """
         imported = 0
         skipped = 0
         updated = 0
+        batch = []
+        invalid_rows = []
+        # Held back until the whole file is read, so a fallback does not repeat them
+        warnings = []
+        
+        # Leave empty files and missing columns to the csv module path, so they are reported the same way
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            header = next(csv.reader(file), None)
+        if header is None or any(column not in header for column in CSV_COLUMNS):
+            return None
+        
+        def skip_invalid_row(row):
+            invalid_rows.append(row)
+            return 'skip'
+        
+        reader = pyarrow_csv.open_csv(
+            file_path,
+            parse_options=pyarrow_csv.ParseOptions(
+                newlines_in_values=True, invalid_row_handler=skip_invalid_row
+            ),
+            convert_options=pyarrow_csv.ConvertOptions(
+                include_columns=list(CSV_COLUMNS),
+                column_types={column: pyarrow.string() for column in CSV_COLUMNS},
+                strings_can_be_null=False,
+            ),
+        )
         
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
+        try:
+            for record_batch in reader:
+                if invalid_rows:
+                    return None
+                columns = [record_batch.column(column).to_pylist() for column in CSV_COLUMNS]
             
-            for row in reader:
-                try:
-                    poi_data = {
-                        'external_id': row['poi_id'],
-                        'name': row['poi_name'],
-                        'latitude': Decimal(row['poi_latitude']),
-                        'longitude': Decimal(row['poi_longitude']),
-                        'category': row['poi_category'],
-                        'ratings': self.parse_ratings(row['poi_ratings']),
-                    }
-                    
-                    imported_count, skipped_count, updated_count = self.save_poi(
-                        poi_data, update_existing
-                    )
-                    imported += imported_count
-                    skipped += skipped_count
-                    updated += updated_count
-                    
-                except KeyError as e:
-                    self.stdout.write(
-                        self.style.WARNING(f'Missing required field in CSV: {e}')
-                    )
-                    skipped += 1
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(f'Error processing CSV row: {e}')
-                    )
-                    skipped += 1
+                for values in zip(*columns):
+                    poi_data, error = self.parse_csv_row(values, file_path)
+                    if error is None:
+                        batch.append(poi_data)
+                    else:
+                        warnings.append(error)
+                        skipped += 1
+                
+                    if len(batch) >= self.batch_size:
+                        imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+        except pyarrow.ArrowInvalid:
+            # Malformed input; let the csv module path handle and report it
+            return None
+                
+        if invalid_rows:
+            return None
+            
+        imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+        
+        for warning in warnings:
+            self.stdout.write(self.style.WARNING(warning))
         
         return imported, skipped, updated
 
@@ -300,7 +515,8 @@ class Command(BaseCommand):
         skipped = 0
         updated = 0
         
-        with open(file_path, 'r', encoding='utf-8') as file:
+        # Hand the raw bytes to the JSON parser instead of decoding them first
+        with open(file_path, 'rb') as file:
             return self.import_json_from_content(file.read(), update_existing, file_path)
 
         return imported, skipped, updated
@@ -310,37 +526,25 @@ class Command(BaseCommand):
         imported = 0
         skipped = 0
         updated = 0
+        batch = []
         
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Handle different XML structures
-            poi_elements = root.findall('.//poi') or root.findall('.//point') or root.findall('.//item')
-            
-            if not poi_elements:
-                # Try to treat the root as a single POI
-                poi_elements = [root]
-            
-            for poi_element in poi_elements:
+            for poi_element in self.iter_xml_elements(file_path):
                 try:
+                    # Index the children once instead of scanning them for every field;
+                    # reversed() keeps the first child of each tag, as find() did
+                    fields = {child.tag: child.text for child in reversed(poi_element)}
                     poi_data = {
-                        'external_id': poi_element.find('pid').text,
-                        'name': poi_element.find('pname').text,
-                        'latitude': Decimal(poi_element.find('platitude').text),
-                        'longitude': Decimal(poi_element.find('plongitude').text),
-                        'category': poi_element.find('pcategory').text,
-                        'ratings': self.parse_ratings(poi_element.find('pratings').text),
+                        'external_id': fields['pid'],
+                        'name': fields['pname'],
+                        'latitude': Decimal(fields['platitude']),
+                        'longitude': Decimal(fields['plongitude']),
+                        'category': fields['pcategory'],
+                        'ratings': self.parse_ratings(fields['pratings']),
                     }
+                    batch.append(poi_data)
                     
-                    imported_count, skipped_count, updated_count = self.save_poi(
-                        poi_data, update_existing
-                    )
-                    imported += imported_count
-                    skipped += skipped_count
-                    updated += updated_count
-                    
-                except AttributeError as e:
+                except KeyError as e:
                     self.stdout.write(
                         self.style.WARNING(f'Missing required field in XML: {e}')
                     )
@@ -351,54 +555,290 @@ class Command(BaseCommand):
                     )
                     skipped += 1
                     
+                if len(batch) >= self.batch_size:
+                    imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+        
         except ET.ParseError as e:
             raise CommandError(f'Invalid XML file: {e}')
         
+        imported, skipped, updated = self.flush_batch(batch, update_existing, imported, skipped, updated)
+        
         return imported, skipped, updated
 
+    def iter_xml_elements(self, source):
+        """Yield POI elements from an XML file or stream as they are parsed.
+        
+        Elements are detached from the tree once processed, so memory stays
+        bounded regardless of the document size.
+        """
+        if HAS_LXML:
+            yield from self.iter_lxml_elements(source)
+            return
+        
+        parents = []
+        poi_tag = None
+        
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                parents.append(elem)
+                continue
+            
+            parents.pop()
+            
+            if poi_tag is None and elem.tag in POI_TAGS:
+                poi_tag = elem.tag
+            
+            if elem.tag == poi_tag:
+                yield elem
+                elem.clear()
+                if parents:
+                    parents[-1].remove(elem)
+            elif not parents and poi_tag is None:
+                # Try to treat the root as a single POI
+                yield elem
+
+    def iter_lxml_elements(self, source):
+        """Yield POI elements like iter_xml_elements, letting lxml match the tags in C.
+        
+        Only the end events of POI tags reach Python; the parent stack the
+        standard library path keeps is replaced by getparent().
+        """
+        context = ET.iterparse(source, events=('end',), tag=tuple(POI_TAGS), resolve_entities=False)
+        poi_tag = None
+        
+        for _, elem in context:
+            if poi_tag is None:
+                poi_tag = elem.tag
+            elif elem.tag != poi_tag:
+                continue
+            
+            yield elem
+            elem.clear()
+            # Drop the POIs already processed, which lxml keeps as preceding siblings
+            parent = elem.getparent()
+            while elem.getprevious() is not None:
+                del parent[0]
+        
+        if poi_tag is None:
+            # Try to treat the root as a single POI
+            yield context.root
+
     def parse_ratings(self, ratings_data):
         """Parse ratings data from various formats."""
         if isinstance(ratings_data, list):
             return ratings_data
         elif isinstance(ratings_data, str):
-            try:
-                # Try to parse as JSON
-                return json.loads(ratings_data)
-            except json.JSONDecodeError:
-                # Try to parse as comma-separated values
+            ratings_data = ratings_data.strip()
+            # Dispatch on the first character rather than trying JSON first and
+            # falling back on the exception, which most CSV/XML inputs would hit
+            if ratings_data[:1] == '[':
                 try:
-                    return [float(x.strip()) for x in ratings_data.strip("{}").split(',') if x]
-                except ValueError:
-                    # Try to parse as single number
-                    try:
-                        return [float(ratings_data)]
-                    except ValueError:
-                        return []
+                    return json_loads(ratings_data)
+                except json.JSONDecodeError:
+                    return []
+            # Comma-separated values, optionally wrapped in braces, or a single number
+            try:
+                return [float(x) for x in ratings_data.strip("{}").split(',') if x.strip()]
+            except ValueError:
+                return []
         else:
             return []
 
-    @transaction.atomic
-    def save_poi(self, poi_data, update_existing):
-        """Save a Point of Interest to the database."""
-        try:
-            poi, created = PointOfInterest.objects.get_or_create(
-                external_id=poi_data['external_id'],
-                defaults=poi_data
-            )
+    def flush_batch(self, batch, update_existing, imported, skipped, updated):
+        """Save and empty a batch, returning the running totals with its counts added."""
+        imported_count, skipped_count, updated_count = self.save_pois(batch, update_existing)
+        batch.clear()
+        return imported + imported_count, skipped + skipped_count, updated + updated_count
+
+    def save_pois(self, batch, update_existing):
+        """Save a batch of Points of Interest to the database.
+        
+        Existing records are looked up with a single query per batch, new
+        records are written with bulk_create and, when update_existing is set,
+        existing ones are upserted on external_id, or written with bulk_update
+        on backends without conflict targets. Each batch runs in a savepoint;
+        if it fails, its records are retried one by one.
+        """
+        imported = 0
+        skipped = 0
+        updated = 0
+        
+        if not batch:
+            return imported, skipped, updated
+        
+        if self.dry_run:
+            # Build the records in memory only, so parsing can be profiled without database time
+            for poi_data in batch:
+                PointOfInterest(**poi_data).update_rating_totals()
+            return len(batch), 0, 0  # imported, skipped, updated
+        
+        batch_ids = [poi_data['external_id'] for poi_data in batch]
+        # One indexed IN lookup per batch instead of a SELECT per record
+        # Primary keys are only needed by backends that cannot upsert on external_id
+        existing = dict(
+            PointOfInterest.objects.filter(external_id__in=batch_ids).values_list('external_id', 'internal_id')
+        )
+        
+        new_objs = {}
+        update_objs = {}
+        update_fields = set()
+        
+        for poi_data in batch:
+            external_id = poi_data['external_id']
             
-            if created:
-                return 1, 0, 0  # imported, skipped, updated
-            elif update_existing:
-                # Update existing record
+            if external_id in existing:
+                if not update_existing:
+                    skipped += 1
+                    continue
+                # Later duplicates in the same batch win, as with per-row saves
+                update_objs[external_id] = PointOfInterest(**poi_data)
+                update_fields.update(poi_data)
+                updated += 1
+            elif external_id in new_objs:
+                if not update_existing:
+                    skipped += 1
+                    continue
                 for field, value in poi_data.items():
-                    setattr(poi, field, value)
-                poi.save()
-                return 0, 0, 1  # imported, skipped, updated
+                    setattr(new_objs[external_id], field, value)
+                updated += 1
             else:
-                return 0, 1, 0  # imported, skipped, updated
+                new_objs[external_id] = PointOfInterest(**poi_data)
+                imported += 1
+        
+        # bulk_create bypasses save(), so refresh the stored rating totals here
+        for poi in [*new_objs.values(), *update_objs.values()]:
+            poi.update_rating_totals()
+        
+        try:
+            # Savepoint so a failed batch does not abort the file transaction
+            with transaction.atomic():
+                if update_objs:
+                    update_fields.discard('external_id')
+                    update_fields.update(('ratings_sum', 'ratings_count', 'average_rating', 'updated_at'))
                 
+                if self.use_copy:
+                    self.copy_insert(new_objs.values())
+                    if update_objs:
+                        self.copy_update(update_objs.values(), sorted(update_fields))
+                else:
+                    PointOfInterest.objects.bulk_create(
+                        new_objs.values(), batch_size=self.batch_size
+                    )
+                    if update_objs and connection.features.supports_update_conflicts_with_target:
+                        # INSERT ... ON CONFLICT is much cheaper to build than bulk_update's CASE/WHEN per field
+                        PointOfInterest.objects.bulk_create(
+                            update_objs.values(),
+                            batch_size=self.batch_size,
+                            update_conflicts=True,
+                            unique_fields=['external_id'],
+                            update_fields=sorted(update_fields),
+                        )
+                    elif update_objs:
+                        # MySQL/MariaDB and Oracle cannot upsert on a given unique field
+                        now = timezone.now()
+                        for external_id, poi in update_objs.items():
+                            poi.pk = existing[external_id]
+                            poi.updated_at = now
+                        PointOfInterest.objects.bulk_update(
+                            update_objs.values(), fields=sorted(update_fields), batch_size=self.batch_size
+                        )
         except Exception as e:
-            self.stdout.write(
-                self.style.WARNING(f'Error saving POI {poi_data.get("external_id", "unknown")}: {e}')
+            if len(batch) == 1:
+                self.stdout.write(
+                    self.style.WARNING(f'Error saving POI {batch[0].get("external_id", "unknown")}: {e}')
+                )
+                return 0, 1, 0  # imported, skipped, updated
+            
+            # Retry one record at a time so only the failing records are skipped
+            imported = 0
+            skipped = 0
+            updated = 0
+            for poi_data in batch:
+                imported, skipped, updated = self.flush_batch([poi_data], update_existing, imported, skipped, updated)
+
+        return imported, skipped, updated
+
+    def copy_insert(self, objs):
+        """Insert new Points of Interest with PostgreSQL COPY."""
+        objs = list(objs)
+        if not objs:
+            return
+        
+        fields = [field for field in PointOfInterest._meta.concrete_fields if not field.primary_key]
+        # COPY does not run pre_save(), so set created_at/updated_at here
+        for obj in objs:
+            for field in fields:
+                field.pre_save(obj, add=True)
+        
+        self.copy_from(PointOfInterest._meta.db_table, fields, objs)
+
+    def copy_update(self, objs, update_fields):
+        """Update existing Points of Interest by COPYing into a temporary table.
+        
+        The rows are loaded with COPY and applied with a single UPDATE ... FROM
+        joined on external_id.
+        """
+        objs = list(objs)
+        meta = PointOfInterest._meta
+        quote_name = connection.ops.quote_name
+        table = quote_name(meta.db_table)
+        temp_table = quote_name(f'{meta.db_table}_copy_update')
+        key = meta.get_field('external_id')
+        fields = [key] + [meta.get_field(name) for name in update_fields]
+        # COPY does not run pre_save(), so set updated_at here
+        for obj in objs:
+            for field in fields:
+                field.pre_save(obj, add=False)
+        columns = ', '.join(quote_name(field.column) for field in fields)
+        assignments = ', '.join(
+            f'{quote_name(field.column)} = src.{quote_name(field.column)}' for field in fields[1:]
+        )
+        
+        with connection.cursor() as cursor:
+            # Copy the column types without the NOT NULL constraints of unloaded columns
+            cursor.execute(f'CREATE TEMPORARY TABLE {temp_table} AS SELECT {columns} FROM {table} WITH NO DATA')
+            self.copy_from(f'{meta.db_table}_copy_update', fields, objs)
+            cursor.execute(
+                f'UPDATE {table} SET {assignments} FROM {temp_table} AS src '
+                f'WHERE {table}.{quote_name(key.column)} = src.{quote_name(key.column)}'
             )
-            return 0, 1, 0  # imported, skipped, updated
+            cursor.execute(f'DROP TABLE {temp_table}')
+
+    def copy_from(self, db_table, fields, objs):
+        """Stream objs into db_table with COPY ... FROM STDIN in text format."""
+        buffer = io.StringIO()
+        for obj in objs:
+            values = []
+            for field in fields:
+                value = getattr(obj, field.attname)
+                if isinstance(field, models.JSONField):
+                    value = json.dumps(value, cls=field.encoder)
+                values.append(self.copy_value(value))
+            buffer.write('\t'.join(values))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        quote_name = connection.ops.quote_name
+        columns = ', '.join(quote_name(field.column) for field in fields)
+        sql = f'COPY {quote_name(db_table)} ({columns}) FROM STDIN'
+        
+        with connection.cursor() as cursor:
+            if hasattr(cursor, 'copy_expert'):
+                # psycopg2
+                cursor.copy_expert(sql, buffer)
+            else:
+                # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.read())
+
+    def copy_value(self, value):
+        """Format a value for COPY's text format, where NULL is written as \\N."""
+        if value is None:
+            return '\\N'
+        return (
+            str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r')
+        )
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-14 14:40
+
+from django.db import migrations, models
+
+
+def populate_average_rating(apps, schema_editor):
+    PointOfInterest = apps.get_model('poi', 'PointOfInterest')
+    batch = []
+    for poi in PointOfInterest.objects.only('internal_id', 'ratings').iterator(chunk_size=1000):
+        ratings = poi.ratings
+        if isinstance(ratings, (int, float)):
+            poi.average_rating = float(ratings)
+        elif isinstance(ratings, list) and ratings:
+            try:
+                poi.average_rating = sum(ratings) / len(ratings)
+            except (TypeError, ValueError):
+                poi.average_rating = 0.0
+        else:
+            poi.average_rating = 0.0
+        batch.append(poi)
+        if len(batch) >= 1000:
+            PointOfInterest.objects.bulk_update(batch, ['average_rating'])
+            batch = []
+    PointOfInterest.objects.bulk_update(batch, ['average_rating'])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poi', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pointofinterest',
+            name='average_rating',
+            field=models.FloatField(db_index=True, default=0.0, help_text='Average of the ratings for this PoI'),
+        ),
+        migrations.RunPython(populate_average_rating, migrations.RunPython.noop),
+    ]
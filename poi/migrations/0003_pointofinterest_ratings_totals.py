@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-14 14:46
+
+from django.db import migrations, models
+
+
+def populate_ratings_totals(apps, schema_editor):
+    PointOfInterest = apps.get_model('poi', 'PointOfInterest')
+    batch = []
+    for poi in PointOfInterest.objects.only('internal_id', 'ratings').iterator(chunk_size=1000):
+        ratings = poi.ratings
+        if isinstance(ratings, (int, float)):
+            poi.ratings_sum, poi.ratings_count = float(ratings), 1
+        elif isinstance(ratings, list) and ratings:
+            try:
+                poi.ratings_sum, poi.ratings_count = float(sum(ratings)), len(ratings)
+            except (TypeError, ValueError):
+                poi.ratings_sum, poi.ratings_count = 0.0, 0
+        else:
+            poi.ratings_sum, poi.ratings_count = 0.0, 0
+        batch.append(poi)
+        if len(batch) >= 1000:
+            PointOfInterest.objects.bulk_update(batch, ['ratings_sum', 'ratings_count'])
+            batch = []
+    PointOfInterest.objects.bulk_update(batch, ['ratings_sum', 'ratings_count'])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poi', '0002_pointofinterest_average_rating'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pointofinterest',
+            name='ratings_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of ratings for this PoI'),
+        ),
+        migrations.AddField(
+            model_name='pointofinterest',
+            name='ratings_sum',
+            field=models.FloatField(default=0.0, help_text='Sum of the ratings for this PoI'),
+        ),
+        migrations.RunPython(populate_ratings_totals, migrations.RunPython.noop),
+    ]
@@ -23,6 +23,13 @@ class PointOfInterest(models.Model):
     # Ratings (stored as JSON to handle multiple ratings)
     ratings = models.JSONField(default=list, help_text="List of ratings for this PoI")
     
+    # Rating totals, stored so averages can be computed in the database without reading the JSON
+    ratings_sum = models.FloatField(default=0.0, help_text="Sum of the ratings for this PoI")
+    ratings_count = models.PositiveIntegerField(default=0, help_text="Number of ratings for this PoI")
+    
+    # Average of the ratings list, stored so it can be sorted and filtered in the database
+    average_rating = models.FloatField(default=0.0, db_index=True, help_text="Average of the ratings for this PoI")
+    
     # Additional fields
     description = models.TextField(blank=True, null=True, help_text="Description of the Point of Interest")
     
@@ -38,17 +45,26 @@ class PointOfInterest(models.Model):
     def __str__(self):
         return f"{self.name} ({self.external_id})"
     
-    @property
-    def average_rating(self):
-        """Calculate the average rating from the ratings list."""
+    def save(self, *args, **kwargs):
+        self.update_rating_totals()
+        super().save(*args, **kwargs)
+    
+    def update_rating_totals(self):
+        """Recalculate ratings_sum, ratings_count and average_rating from the ratings list."""
+        self.ratings_sum, self.ratings_count = self.summarize_ratings(self.ratings)
+        self.average_rating = self.ratings_sum / self.ratings_count if self.ratings_count else 0.0
+    
+    @staticmethod
+    def summarize_ratings(ratings):
+        """Return the (sum, count) of a ratings list."""
         try:
-            if not self.ratings:
-                return 0.0
+            if not ratings:
+                return 0.0, 0
             # Ensure ratings is a list
-            if isinstance(self.ratings, (int, float)):
-                return float(self.ratings)
-            if isinstance(self.ratings, list):
-                return sum(self.ratings) / len(self.ratings)
-            return 0.0
-        except (TypeError, ValueError, ZeroDivisionError):
-            return 0.0
+            if isinstance(ratings, (int, float)):
+                return float(ratings), 1
+            if isinstance(ratings, list):
+                return float(sum(ratings)), len(ratings)
+            return 0.0, 0
+        except (TypeError, ValueError):
+            return 0.0, 0
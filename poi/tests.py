@@ -1,3 +1,242 @@
+import os
+import re
+import tempfile
+import xml.etree.ElementTree
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from poi.management.commands import import_poi
+from poi.models import PointOfInterest
+
+CSV_HEADER = 'poi_id,poi_name,poi_latitude,poi_longitude,poi_category,poi_ratings\n'
+
+
+class ImportPoiTestCase(TestCase):
+    """Base class that writes import files to a temporary directory."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write_file(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+        return path
+
+    def import_poi(self, *args):
+        """Run the command and return its (imported, skipped, updated) totals."""
+        out = StringIO()
+        call_command('import_poi', *args, stdout=out)
+        match = re.search(r'Total: (\d+) imported, (\d+) skipped, (\d+) updated', out.getvalue())
+        return tuple(int(count) for count in match.groups())
+
+    def stored(self):
+        """Return the stored POIs as comparable tuples."""
+        return list(
+            PointOfInterest.objects.order_by('external_id').values_list(
+                'external_id', 'name', 'latitude', 'longitude', 'category', 'ratings', 'average_rating'
+            )
+        )
+
+
+class ImportCountsTests(ImportPoiTestCase):
+    """Imported, skipped and updated counts with and without --update."""
+
+    def setUp(self):
+        super().setUp()
+        self.path = self.write_file(
+            'pois.csv',
+            CSV_HEADER
+            + 'A1,One,1.0,2.0,Park,"{4,5}"\n'
+            + 'A2,Two,1.5,2.5,Cafe,3\n'
+            + 'A3,Three,1.0,2.0,Shop,\n',
+        )
+
+    def test_new_records_are_imported(self):
+        self.assertEqual(self.import_poi(self.path), (3, 0, 0))
+        poi = PointOfInterest.objects.get(external_id='A1')
+        self.assertEqual(poi.ratings, [4.0, 5.0])
+        self.assertEqual((poi.ratings_sum, poi.ratings_count, poi.average_rating), (9.0, 2, 4.5))
+        self.assertEqual(PointOfInterest.objects.get(external_id='A3').ratings, [])
+
+    def test_existing_records_are_skipped_without_update(self):
+        self.import_poi(self.path)
+        PointOfInterest.objects.filter(external_id='A1').update(name='Changed')
+        self.assertEqual(self.import_poi(self.path), (0, 3, 0))
+        self.assertEqual(PointOfInterest.objects.get(external_id='A1').name, 'Changed')
+
+    def test_existing_records_are_updated_with_update(self):
+        self.import_poi(self.path)
+        PointOfInterest.objects.filter(external_id='A1').update(name='Changed', description='Kept')
+        self.assertEqual(self.import_poi(self.path, '--update'), (0, 0, 3))
+        poi = PointOfInterest.objects.get(external_id='A1')
+        self.assertEqual(poi.name, 'One')
+        # CSV rows carry no description, so an update must not clear it
+        self.assertEqual(poi.description, 'Kept')
+
+    def test_update_falls_back_to_bulk_update_without_conflict_targets(self):
+        self.import_poi(self.path)
+        PointOfInterest.objects.filter(external_id='A1').update(name='Changed')
+        with mock.patch.object(
+            import_poi.connection.features, 'supports_update_conflicts_with_target', False
+        ):
+            self.assertEqual(self.import_poi(self.path, '--update'), (0, 0, 3))
+        self.assertEqual(PointOfInterest.objects.get(external_id='A1').name, 'One')
+
+    def test_all_formats(self):
+        json_path = self.write_file(
+            'pois.json',
+            '[{"id": "J1", "name": "Json", "coordinates": {"latitude": 1.0, "longitude": 2.0}, '
+            '"category": "Park", "ratings": [2, 4], "description": "From JSON"}]',
+        )
+        xml_path = self.write_file(
+            'pois.xml',
+            '<pois><poi><pid>X1</pid><pname>Xml</pname><platitude>1.0</platitude>'
+            '<plongitude>2.0</plongitude><pcategory>Park</pcategory><pratings>3,5</pratings></poi></pois>',
+        )
+        self.assertEqual(self.import_poi(self.path, json_path, xml_path), (5, 0, 0))
+        self.assertEqual(PointOfInterest.objects.get(external_id='J1').description, 'From JSON')
+        self.assertEqual(PointOfInterest.objects.get(external_id='X1').average_rating, 4.0)
+
+
+class DuplicateRecordTests(ImportPoiTestCase):
+    """Repeated external_ids within one batch and across batches."""
+
+    def setUp(self):
+        super().setUp()
+        self.path = self.write_file(
+            'duplicates.csv',
+            CSV_HEADER
+            + 'D1,First,1.0,2.0,Park,1\n'
+            + 'D2,Other,1.0,2.0,Park,2\n'
+            + 'D1,Second,1.0,2.0,Park,3\n',
+        )
+
+    def test_duplicate_within_batch_is_skipped_without_update(self):
+        self.assertEqual(self.import_poi(self.path), (2, 1, 0))
+        self.assertEqual(PointOfInterest.objects.get(external_id='D1').name, 'First')
+
+    def test_duplicate_within_batch_keeps_last_row_with_update(self):
+        self.assertEqual(self.import_poi(self.path, '--update'), (2, 0, 1))
+        self.assertEqual(PointOfInterest.objects.get(external_id='D1').name, 'Second')
+
+    def test_duplicate_across_batches_is_skipped_without_update(self):
+        self.assertEqual(self.import_poi(self.path, '--batch-size', '1'), (2, 1, 0))
+        self.assertEqual(PointOfInterest.objects.get(external_id='D1').name, 'First')
+
+    def test_duplicate_across_batches_keeps_last_row_with_update(self):
+        self.assertEqual(self.import_poi(self.path, '--update', '--batch-size', '1'), (2, 0, 1))
+        self.assertEqual(PointOfInterest.objects.get(external_id='D1').name, 'Second')
+
+
+class FailingRecordTests(ImportPoiTestCase):
+    """A record the database rejects only skips that record."""
+
+    def test_failing_record_is_isolated_within_its_batch(self):
+        path = self.write_file(
+            'pois.xml',
+            '<pois>'
+            '<poi><pid>F1</pid><pname>One</pname><platitude>1</platitude><plongitude>2</plongitude>'
+            '<pcategory>Park</pcategory><pratings>1</pratings></poi>'
+            '<poi><pid>F2</pid><pname/><platitude>1</platitude><plongitude>2</plongitude>'
+            '<pcategory>Park</pcategory><pratings>1</pratings></poi>'
+            '<poi><pid>F3</pid><pname>Three</pname><platitude>1</platitude><plongitude>2</plongitude>'
+            '<pcategory>Park</pcategory><pratings>1</pratings></poi>'
+            '</pois>',
+        )
+        self.assertEqual(self.import_poi(path), (2, 1, 0))
+        self.assertEqual(
+            list(PointOfInterest.objects.order_by('external_id').values_list('external_id', flat=True)),
+            ['F1', 'F3'],
+        )
+
+    def test_truncated_xml_imports_nothing(self):
+        path = self.write_file(
+            'truncated.xml',
+            '<pois><poi><pid>T1</pid><pname>One</pname><platitude>1</platitude><plongitude>2</plongitude>'
+            '<pcategory>Park</pcategory><pratings>1</pratings></poi><poi><pid>T2</pid><pna',
+        )
+        self.assertEqual(self.import_poi(path, '--batch-size', '1'), (0, 0, 0))
+        self.assertFalse(PointOfInterest.objects.exists())
+
+
+class DryRunTests(ImportPoiTestCase):
+    """--dry-run parses the files without touching the database."""
+
+    def test_dry_run_writes_nothing(self):
+        path = self.write_file('pois.csv', CSV_HEADER + 'R1,One,1.0,2.0,Park,1\nR2,Two,1.0,2.0,Park,2\n')
+        self.assertEqual(self.import_poi(path, '--dry-run'), (2, 0, 0))
+        self.assertFalse(PointOfInterest.objects.exists())
+
+
+class OptionalBackendParityTests(ImportPoiTestCase):
+    """The optional parsers must store the same records as the standard library ones."""
+
+    def import_both_ways(self, path, patches):
+        """Import path with the optional backends, then without them, and return both stored results."""
+        self.import_poi(path, '--update')
+        with_optional = self.stored()
+        PointOfInterest.objects.all().delete()
+        with mock.patch.multiple(import_poi, **patches):
+            self.import_poi(path, '--update')
+        return with_optional, self.stored()
+
+    @skipUnless(import_poi.pyarrow_csv is not None, 'pyarrow is not installed')
+    def test_csv_with_and_without_pyarrow(self):
+        path = self.write_file(
+            'pois.csv',
+            CSV_HEADER
+            + 'P1,First,1.0,2.0,Park,"4",extra\n'
+            + 'P1,Second,1.0,2.0,Park,"5"\n'
+            + 'P2,"Multi\nline",1.0,2.0,Park,"{1,2}"\n'
+            + 'P3,No ratings,1.0,2.0,Park\n'
+            + 'P4,Short,1.0\n'
+            + 'P5,Bad,north,2.0,Park,1\n',
+        )
+        with_pyarrow, without_pyarrow = self.import_both_ways(path, {'pyarrow_csv': None})
+        self.assertEqual(with_pyarrow, without_pyarrow)
+        self.assertEqual(PointOfInterest.objects.get(external_id='P1').name, 'Second')
+        self.assertEqual([poi[0] for poi in without_pyarrow], ['P1', 'P2', 'P3'])
+
+    @skipUnless(import_poi.HAS_LXML, 'lxml is not installed')
+    def test_xml_with_and_without_lxml(self):
+        path = self.write_file(
+            'pois.xml',
+            '<DATA><DATA_RECORD><pid>L1</pid><pname>One</pname><platitude>1</platitude>'
+            '<plongitude>2</plongitude><pcategory>Park</pcategory><pratings>1,2</pratings></DATA_RECORD>'
+            '<DATA_RECORD><pid>L2</pid><pname>Two</pname><pname>Ignored</pname><platitude>1</platitude>'
+            '<plongitude>2</plongitude><pcategory>Park</pcategory><pratings>[3, 4]</pratings></DATA_RECORD>'
+            '<DATA_RECORD><pid>L3</pid><platitude>1</platitude></DATA_RECORD></DATA>',
+        )
+        with_lxml, without_lxml = self.import_both_ways(
+            path, {'ET': xml.etree.ElementTree, 'HAS_LXML': False}
+        )
+        self.assertEqual(with_lxml, without_lxml)
+        self.assertEqual([poi[:2] for poi in without_lxml], [('L1', 'One'), ('L2', 'Two')])
+
+    def test_single_root_poi_with_and_without_lxml(self):
+        path = self.write_file(
+            'poi.xml',
+            '<record><pid>S1</pid><pname>Single</pname><platitude>1</platitude>'
+            '<plongitude>2</plongitude><pcategory>Park</pcategory><pratings>5</pratings></record>',
+        )
+        with_lxml, without_lxml = self.import_both_ways(
+            path, {'ET': xml.etree.ElementTree, 'HAS_LXML': False}
+        )
+        self.assertEqual(with_lxml, without_lxml)
+        self.assertEqual([poi[:2] for poi in without_lxml], [('S1', 'Single')])
+
+    def test_json_with_and_without_orjson(self):
+        path = self.write_file(
+            'pois.json',
+            '{"id": 7, "name": "Json", "coordinates": {"latitude": 1.25, "longitude": 2.5}, '
+            '"category": "Park", "ratings": "[1, 2.5]"}',
+        )
+        with_orjson, without_orjson = self.import_both_ways(path, {'json_loads': import_poi.json.loads})
+        self.assertEqual(with_orjson, without_orjson)
+        self.assertEqual([poi[5] for poi in without_orjson], [[1, 2.5]])